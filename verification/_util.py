@@ -0,0 +1,33 @@
+import os
+from contextlib import contextmanager
+
+from playwright.sync_api import sync_playwright
+
+IDE_URL = "http://localhost:5173/ide.html"
+
+# The command processor logs this line once the Golden Layout resize has been applied.
+FULL_REPL_APPLIED = """() => Array.from(document.querySelectorAll('.repl-cell'))
+    .some(cell => cell.textContent.includes('Layout: Full REPL'))"""
+
+@contextmanager
+def page_session(headless=True):
+    """Yield a page; page errors are printed and the browser closed on exit."""
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=headless)
+        page = browser.new_page()
+
+        # Capture console logs only when asked to (VERBOSE=1): every event is a
+        # round-trip from the browser, and the IDE logs a lot while booting.
+        if os.environ.get("VERBOSE"):
+            page.on("console", lambda msg: print(f"Console: {msg.text}"))
+
+        # Page errors are buffered and reported once at the end of the session.
+        page_errors = []
+        page.on("pageerror", page_errors.append)
+
+        try:
+            yield page
+        finally:
+            for exc in page_errors:
+                print(f"Page Error: {exc}\nStack: {exc.stack}")
+            browser.close()
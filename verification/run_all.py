@@ -0,0 +1,44 @@
+import glob
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+VERIFICATION_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def run_script(path):
+    # Each script runs in its own process with its own browser; its exit code is the result.
+    # Output is streamed line by line (-u disables buffering) so a hung script is visible.
+    name = os.path.splitext(os.path.basename(path))[0]
+    proc = subprocess.Popen(
+        [sys.executable, "-u", path],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    for line in proc.stdout:
+        print(f"[{name}] {line.rstrip()}", flush=True)
+    return proc.wait() == 0
+
+def run():
+    scripts = sorted(glob.glob(os.path.join(VERIFICATION_DIR, "verify_*.py")))
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=len(scripts)) as pool:
+        futures = {pool.submit(run_script, path): os.path.basename(path) for path in scripts}
+        for future in as_completed(futures):
+            script = futures[future]
+            if future.result():
+                print(f"PASSED: {script}", flush=True)
+            else:
+                print(f"FAILED: {script}", flush=True)
+                failed.append(script)
+
+    if failed:
+        print(f"Failed: {', '.join(failed)}")
+    else:
+        print("All verifications passed!")
+    return not failed
+
+if __name__ == "__main__":
+    sys.exit(0 if run() else 1)
@@ -1,18 +1,12 @@
-from playwright.sync_api import sync_playwright
-import time
+import sys
 
-def run():
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
-
-        # Capture console logs
-        page.on("console", lambda msg: print(f"Console: {msg.text}"))
-        page.on("pageerror", lambda exc: print(f"Page Error: {exc}\nStack: {exc.stack}"))
+from _util import FULL_REPL_APPLIED, IDE_URL, page_session
 
+def run():
+    with page_session() as page:
         print("Navigating...")
         try:
-            page.goto("http://localhost:5173/ide.html", timeout=30000)
+            page.goto(IDE_URL, timeout=30000)
 
             print("Waiting for layout root...")
             page.wait_for_selector(".lm_root", state="visible", timeout=10000)
@@ -32,28 +26,27 @@ def run():
             textarea.fill("/layout full-repl")
 
             # Click execute button
-            # We look for the button with the text "Execute" or use the click on button logic
             print("Clicking execute...")
-            # REPLInput creates a button "▶️ Execute (Ctrl+Enter)"
-            # Use partial text match
-            page.get_by_text("Execute", exact=False).first.click()
+            # REPLInput creates a button "▶️ Execute (Shift+Enter)" in its bottom toolbar
+            # Role lookup scoped to the input area; the accessible name is matched as a substring
+            page.locator(".repl-input-area").get_by_role("button", name="Execute").click()
 
-            # Wait a bit for layout change
-            time.sleep(2)
+            # Wait for layout change
+            page.wait_for_function(FULL_REPL_APPLIED, timeout=5000)
 
             print("Taking screenshot...")
-            page.screenshot(path="full_demo_screenshot.png")
+            page.screenshot(path="full_demo_screenshot.jpg", type="jpeg", quality=70)
             print("Verification passed!")
+            return True
 
         except Exception as e:
             print(f"Verification failed: {e}")
-            page.screenshot(path="error_screenshot.png")
+            page.screenshot(path="error_screenshot.jpg", type="jpeg", quality=70)
             try:
                 print(f"REPL HTML on error: {page.inner_html('.repl-input-area')}")
             except:
                 pass
-        finally:
-            browser.close()
+            return False
 
 if __name__ == "__main__":
-    run()
+    sys.exit(0 if run() else 1)